@@ -10,58 +10,418 @@ bl_info = {
 
 import bpy
 import os
-import glob
+import functools
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from bpy.props import StringProperty, IntProperty, BoolProperty
-from bpy.types import Operator, Panel, PropertyGroup
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.app.handlers import persistent
 
 
-def check_udim_exists(filepath):
-    """Check if a UDIM texture exists by looking for any tile (1001, 1002, etc.)"""
-    if "<UDIM>" not in filepath:
-        # Not a UDIM texture, check normally
-        return os.path.exists(bpy.path.abspath(filepath))
+# Modifier types that store an external file in their 'filepath' property
+# (Multires keeps its external displacement file there; Mesh Sequence Cache
+# uses a CacheFile datablock instead)
+FILEPATH_MODIFIER_TYPES = frozenset({'MESH_CACHE', 'MULTIRES', 'OCEAN'})
+
+# Panel groups: (file_type, label, icon, collapse/expand setting)
+FILE_TYPE_GROUPS = (
+    ('IMAGE', 'Images', 'IMAGE_DATA', 'show_images'),
+    ('MOVIE', 'Movies', 'SEQUENCE', 'show_movies'),
+    ('SOUND', 'Sounds', 'SOUND', 'show_sounds'),
+    ('CACHE', 'Caches', 'FILE_CACHE', 'show_caches'),
+    ('LINKED', 'Linked Files', 'LINK_BLEND', 'show_linked'),
+)
+
+# Position of each file type in FILE_TYPE_GROUPS, other types are shown with images
+FILE_TYPE_INDICES = {group[0]: index for index, group in enumerate(FILE_TYPE_GROUPS)}
+
+# Print per-folder and per-file progress to the console during searches.
+# Off by default, printing thousands of lines can take longer than the search
+DEBUG = False
+
+# Folders never worth searching for missing files. Hidden folders (.git,
+# .svn, .cache...) are skipped as well
+SKIP_FOLDERS = frozenset({'node_modules', '__pycache__', '$RECYCLE.BIN', 'System Volume Information'})
+
+# A UDIM tile number, what <UDIM> stands for in a filename
+UDIM_TILE_NUMBER = re.compile(r"[0-9]{4}")
+
+# Finds every 4-digit run in a filename (overlapping) so UDIM tiles can be
+# indexed under their <UDIM> name
+UDIM_TILE_PATTERN = re.compile(r"(?=[0-9]{4})")
+
+
+@functools.lru_cache(maxsize=4096)
+def resolve_path(filepath, blend_dir):
+    """Make a '//' blend-relative path absolute, memoized since the same paths come up again and again"""
+    if filepath.startswith("//"):
+        return os.path.join(blend_dir, filepath[2:])
+    return filepath
+
+
+@functools.lru_cache(maxsize=1024)
+def relative_folder(folder, blend_dir):
+    """os.path.relpath of a folder, memoized since found files are usually grouped in a few folders"""
+    return os.path.relpath(folder, blend_dir)
+
+
+def make_relative(filepath, blend_dir):
+    """Make an absolute path '//' blend-relative like bpy.path.relpath, or return it unchanged if that's not possible"""
+    if not blend_dir or filepath.startswith("//"):
+        return filepath
     
-    # Replace <UDIM> with glob pattern to find any tile
-    abs_path = bpy.path.abspath(filepath)
-    pattern = abs_path.replace("<UDIM>", "[0-9][0-9][0-9][0-9]")
+    folder, filename = os.path.split(filepath)
+    try:
+        rel_folder = relative_folder(folder, blend_dir)
+    except ValueError:
+        return filepath  # On another drive
     
-    # Check if any files match the pattern
-    matches = glob.glob(pattern)
-    return len(matches) > 0
+    if rel_folder == os.curdir:
+        return "//" + filename
+    return "//" + os.path.join(rel_folder, filename)
 
 
-def find_udim_file(filepath, search_directory):
-    """Find a UDIM texture in the search directory"""
-    if "<UDIM>" not in filepath:
+def list_directory(directory, dir_cache=None):
+    """Return the entry names (normcased) of a directory, or None if it can't be listed.
+    
+    Pass a dict as dir_cache to list each directory only once across calls.
+    """
+    if dir_cache is not None and directory in dir_cache:
+        return dir_cache[directory]
+    
+    try:
+        with os.scandir(directory) as entries:
+            names = {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        names = None
+    
+    if dir_cache is not None:
+        dir_cache[directory] = names
+    return names
+
+
+def check_udim_exists(filepath, dir_cache=None, blend_dir=None):
+    """Check if a file exists, for UDIM textures by looking for any tile (1001, 1002, etc.)
+    
+    With a dir_cache dict, answers come from cached directory listings so
+    checking many files in the same folder lists it only once. Callers that
+    already resolved the path (or know the blend directory) pass blend_dir to
+    skip reading bpy.data.filepath.
+    """
+    if blend_dir is None:
+        blend_dir = os.path.dirname(bpy.data.filepath)
+    abs_path = resolve_path(filepath, blend_dir)
+    
+    if dir_cache is None and "<UDIM>" not in abs_path:
         # Not a UDIM texture, check normally
-        filename = os.path.basename(filepath)
-        potential_path = os.path.join(search_directory, filename)
-        return potential_path if os.path.exists(potential_path) else None
+        return os.path.exists(abs_path)
+    
+    directory, filename = os.path.split(abs_path)
+    names = list_directory(directory, dir_cache)
+    if names is None:
+        # Folder doesn't exist or can't be listed (e.g. no read permission),
+        # a plain file in it may still be reachable
+        return "<UDIM>" not in filename and os.path.exists(abs_path)
+    
+    if "<UDIM>" not in filename:
+        # Confirm misses on disk, the filesystem may be case-insensitive
+        return os.path.normcase(filename) in names or os.path.exists(abs_path)
+    
+    # Look for any tile: same text around <UDIM> with a tile number in between
+    prefix, _, suffix = os.path.normcase(filename).partition(os.path.normcase("<UDIM>"))
+    return any(name.startswith(prefix) and name.endswith(suffix)
+               and UDIM_TILE_NUMBER.fullmatch(name, len(prefix), len(name) - len(suffix))
+               for name in names)
+
+
+def udim_name_pattern(names):
+    """Compile one regex matching a tile of any of the <UDIM> names (normcased), or None if there are none"""
+    udim_token = os.path.normcase("<UDIM>")
+    alternatives = []
+    for name in names:
+        if udim_token in name:
+            prefix, _, suffix = name.partition(udim_token)
+            alternatives.append(re.escape(prefix) + "[0-9]{4}" + re.escape(suffix))
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives))
+
+
+def add_to_file_index(file_index, directory, filenames, wanted=None, udim_pattern=None):
+    """Record filenames found in a directory, keeping the first location seen.
+    
+    UDIM tiles are also recorded under their <UDIM> name so UDIM textures can
+    be looked up the same way as regular files. If wanted (a set of normcased
+    names) is given, only those are recorded, and tile numbers are only looked
+    for in filenames matching udim_pattern (see udim_name_pattern).
+    """
+    for filename in filenames:
+        name = os.path.normcase(filename)
+        if wanted is None or name in wanted:
+            file_index.setdefault(name, os.path.join(directory, filename))
+        
+        # One regex test for all wanted UDIM names before looking for tile numbers
+        if wanted is not None and (udim_pattern is None or not udim_pattern.fullmatch(name)):
+            continue
+        for match in UDIM_TILE_PATTERN.finditer(filename):
+            start = match.start()
+            udim_name = filename[:start] + "<UDIM>" + filename[start + 4:]
+            udim_key = os.path.normcase(udim_name)
+            if wanted is None or udim_key in wanted:
+                file_index.setdefault(udim_key, os.path.join(directory, udim_name))
+
+
+def find_in_file_index(file_index, filename):
+    """Look up a missing file by name in an index built by add_to_file_index"""
+    return file_index.get(os.path.normcase(filename))
+
+
+def list_folder(folder):
+    """List a folder with os.scandir, returns (filenames, subfolder paths) or None if it can't be read.
+    
+    Entry types come with the directory listing on most platforms, so unlike
+    os.walk there's no extra stat per entry. Hidden and SKIP_FOLDERS
+    subfolders are left out.
+    """
+    filenames = []
+    subfolders = []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    filenames.append(entry.name)
+                elif not (entry.is_symlink() or entry.name.startswith('.') or entry.name in SKIP_FOLDERS):
+                    subfolders.append(entry.path)
+    except OSError:
+        return None
+    return filenames, subfolders
+
+
+def iter_folder_tree(folder):
+    """Yield (folder, filenames) for a folder and every folder below it, in os.walk order"""
+    stack = [folder]
+    while stack:
+        current = stack.pop()
+        listing = list_folder(current)
+        if listing is None:
+            continue
+        filenames, subfolders = listing
+        yield current, filenames
+        stack.extend(reversed(subfolders))
+
+
+def index_folder_tree(folder, wanted, udim_pattern=None, stop=None):
+    """Walk one folder tree indexing the wanted filenames, returns (file_index, directories_searched)"""
+    file_index = {}
+    remaining = set(wanted)
+    directories_searched = 0
+    
+    for root, files in iter_folder_tree(folder):
+        if stop is not None and stop.is_set():
+            break
+        directories_searched += 1
+        if DEBUG:
+            print(f"  Checking: {root}")
+        add_to_file_index(file_index, root, files, remaining, udim_pattern)
+        
+        remaining.difference_update(file_index)
+        if not remaining:
+            break
+    
+    return file_index, directories_searched
+
+
+def is_walked_by(folder, root):
+    """True if iter_folder_tree(root) also visits folder (both normcased and normalized).
+    
+    Symlinked, hidden and SKIP_FOLDERS folders aren't entered by the walk, so
+    a folder reached through one of them still needs its own walk.
+    """
+    try:
+        relative = os.path.relpath(folder, root)
+    except ValueError:
+        return False  # On another drive
     
-    # For UDIM textures, search for any tile
-    filename = os.path.basename(filepath)
-    pattern_filename = filename.replace("<UDIM>", "[0-9][0-9][0-9][0-9]")
-    pattern = os.path.join(search_directory, pattern_filename)
+    if relative == os.curdir:
+        return True
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        return False
     
-    matches = glob.glob(pattern)
-    if matches:
-        # Return the path with <UDIM> placeholder, not a specific tile
-        return os.path.join(search_directory, filename)
+    current = root
+    for part in relative.split(os.sep):
+        current = os.path.join(current, part)
+        if part.startswith('.') or part in SKIP_FOLDERS or os.path.islink(current):
+            return False
+    return True
+
+
+def index_folders(folders, wanted):
+    """Find the wanted filenames (normcased) under the given folders, returns (file_index, directories_searched).
+    
+    The subfolders of each folder are walked in parallel threads (the time goes
+    into filesystem calls, which release the GIL). Results are merged in walk
+    order, so the first match wins just like with a single os.walk.
+    """
+    file_index = {}
+    remaining = set(wanted)
+    directories_searched = 0
+    searched = []
+    stop = threading.Event()
+    udim_pattern = udim_name_pattern(remaining)
+    
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+        for folder in folders:
+            if not remaining:
+                break
+            
+            # A folder the earlier walks already went through has nothing new to offer
+            folder_key = os.path.normcase(os.path.normpath(folder))
+            if any(is_walked_by(folder_key, done) for done in searched):
+                continue
+            searched.append(folder_key)
+            
+            # Files directly in the folder come first, then each subfolder tree
+            listing = list_folder(folder)
+            if listing is None:
+                continue  # Folder doesn't exist
+            files, subfolders = listing
+            directories_searched += 1
+            add_to_file_index(file_index, folder, files, remaining, udim_pattern)
+            remaining.difference_update(file_index)
+            
+            wanted_below = frozenset(remaining)
+            futures = [executor.submit(index_folder_tree, subfolder, wanted_below, udim_pattern, stop)
+                       for subfolder in subfolders]
+            
+            for future in futures:
+                if not remaining:
+                    # Everything found, let the other walks stop
+                    stop.set()
+                    future.cancel()
+                    continue
+                sub_index, sub_searched = future.result()
+                directories_searched += sub_searched
+                for name, path in sub_index.items():
+                    file_index.setdefault(name, path)
+                remaining.difference_update(file_index)
+        
+        stop.set()
+    
+    return file_index, directories_searched
+
+
+def iter_file_modifiers():
+    """Yield (object, modifier, filepath) for every modifier that references an external file"""
+    for obj in bpy.data.objects:
+        for modifier in obj.modifiers:
+            if modifier.type in FILEPATH_MODIFIER_TYPES:
+                filepath = modifier.filepath
+                if filepath:
+                    yield obj, modifier, filepath
+
+
+def build_filepath_index():
+    """Map each filepath to the datablocks using it: {filepath: [(kind, datablock)]}"""
+    by_filepath = defaultdict(list)
+    
+    for image in bpy.data.images:
+        by_filepath[image.filepath].append(('IMAGE', image))
+    
+    for clip in bpy.data.movieclips:
+        by_filepath[clip.filepath].append(('MOVIE CLIP', clip))
+    
+    for sound in bpy.data.sounds:
+        by_filepath[sound.filepath].append(('SOUND', sound))
+    
+    for obj, modifier, filepath in iter_file_modifiers():
+        by_filepath[filepath].append(('CACHE', modifier))
+    
+    return by_filepath
+
+
+def relink_datablocks(datablocks, new_filepath, to_reload=None):
+    """Point local datablocks at a new file, returns (updated count, skipped linked count).
+    
+    Images are reloaded right away, or added to the to_reload set if one is
+    given so a batch of relinks can reload each image once at the end.
+    """
+    relinked_count = 0
+    skipped_count = 0
+    
+    for kind, datablock in datablocks:
+        if kind == 'CACHE':
+            # Modifiers of linked objects are read-only and raise on assignment
+            try:
+                datablock.filepath = new_filepath
+            except:
+                skipped_count += 1
+                continue
+        elif datablock.library is not None:
+            skipped_count += 1
+            continue  # Linked datablocks are read-only
+        else:
+            datablock.filepath = new_filepath
+            if kind == 'IMAGE':
+                if to_reload is None:
+                    datablock.reload()
+                else:
+                    to_reload.add(datablock)
+        relinked_count += 1
     
-    return None
+    return relinked_count, skipped_count
+
+
+def reload_images(images):
+    """Reload images collected by relink_datablocks"""
+    for image in images:
+        image.reload()
+
+
+# Separators used by pack_names: between the materials/objects/nodes lists,
+# and between the names inside a list (control characters, never in names)
+PACKED_LIST_SEPARATOR = "\x1e"
+PACKED_NAME_SEPARATOR = "\x1f"
+
+
+def pack_names(materials, objects, node_names):
+    """Pack the material, object and node names of a file into one string, stored with a single property write"""
+    return PACKED_LIST_SEPARATOR.join(PACKED_NAME_SEPARATOR.join(sorted(names))
+                                      for names in (materials, objects, node_names))
+
+
+def unpack_names(packed_names):
+    """Return the (materials, objects, nodes) name lists stored by pack_names"""
+    lists = packed_names.split(PACKED_LIST_SEPARATOR)
+    if len(lists) != 3:
+        return [], [], []
+    return tuple(names.split(PACKED_NAME_SEPARATOR) if names else [] for names in lists)
+
+
+def get_base_name(item):
+    """File name of a missing file item (lists saved before base_name existed have it empty)"""
+    return item.base_name or os.path.basename(item.filepath)
 
 
 class MissingFileItem(PropertyGroup):
     """Property group to store missing file information"""
     filepath: StringProperty(name="File Path")
     file_name: StringProperty(name="File Name")
+    base_name: StringProperty(name="Base Name")  # os.path.basename(filepath), cached at scan time
     file_type: StringProperty(name="File Type")  # 'IMAGE', 'MOVIE', 'SOUND', 'LINKED', etc.
-    material_names: StringProperty(name="Materials")
-    object_names: StringProperty(name="Objects")
-    node_names: StringProperty(name="Nodes")
+    file_type_index: IntProperty(name="File Type Index")  # Panel group, see FILE_TYPE_INDICES
+    packed_names: StringProperty(name="Usage")  # Materials, objects and nodes, see pack_names
     is_used: BoolProperty(name="Is Used", default=True)
     is_linked: BoolProperty(name="Is Linked", default=False)
     library_path: StringProperty(name="Library Path", default="")
+    # Display versions of the paths (last 3 components), computed at scan time
+    short_filepath: StringProperty(name="Short File Path")
+    short_library_path: StringProperty(name="Short Library Path")
     new_filepath: StringProperty(
         name="New Path",
         description="New file path for the file",
@@ -70,25 +430,323 @@ class MissingFileItem(PropertyGroup):
 
 
 
+# Bits of MissingFileSettings.visibility_flags
+VISIBILITY_BITS = {
+    'show_used': 1 << 0,
+    'show_unused': 1 << 1,
+    'show_images': 1 << 2,
+    'show_movies': 1 << 3,
+    'show_sounds': 1 << 4,
+    'show_caches': 1 << 5,
+    'show_linked': 1 << 6,
+}
+ALL_VISIBLE = sum(VISIBILITY_BITS.values())
+
+
+def visibility_flag_property(flag, **kwargs):
+    """BoolProperty that reads and writes one bit of visibility_flags"""
+    bit = VISIBILITY_BITS[flag]
+    
+    def get_flag(self):
+        return bool(self.visibility_flags & bit)
+    
+    def set_flag(self, value):
+        if value:
+            self.visibility_flags |= bit
+        else:
+            self.visibility_flags &= ~bit
+    
+    return BoolProperty(get=get_flag, set=set_flag, **kwargs)
+
+
 class MissingFileSettings(PropertyGroup):
     """Settings for filtering missing files"""
-    show_used: BoolProperty(
+    # All show_* toggles are stored as bits of this one int so draw code
+    # can read them with a single property access (see VISIBILITY_BITS)
+    visibility_flags: IntProperty(name="Visibility Flags", default=ALL_VISIBLE)
+    show_used: visibility_flag_property(
+        "show_used",
         name="Show Used",
-        description="Show files that are used in the scene",
-        default=True
+        description="Show files that are used in the scene"
     )
-    show_unused: BoolProperty(
+    show_unused: visibility_flag_property(
+        "show_unused",
         name="Show Unused",
-        description="Show files that are not used in the scene",
+        description="Show files that are not used in the scene"
+    )
+    include_linked: BoolProperty(
+        name="Scan Linked Images",
+        description="On the next scan, also report missing files of images linked from other blend files (they can't be relinked here)",
         default=True
     )
     # Collapse/expand state for each file type
-    show_images: BoolProperty(name="Show Images", default=True)
-    show_movies: BoolProperty(name="Show Movies", default=True)
-    show_sounds: BoolProperty(name="Show Sounds", default=True)
-    show_caches: BoolProperty(name="Show Caches", default=True)
-    show_linked: BoolProperty(name="Show Linked Files", default=True)
+    show_images: visibility_flag_property("show_images", name="Show Images")
+    show_movies: visibility_flag_property("show_movies", name="Show Movies")
+    show_sounds: visibility_flag_property("show_sounds", name="Show Sounds")
+    show_caches: visibility_flag_property("show_caches", name="Show Caches")
+    show_linked: visibility_flag_property("show_linked", name="Show Linked Files")
+    active_index: IntProperty(name="Active File", default=0)
+    # Bumped whenever the missing files list changes, invalidates the panel cache
+    # (see bump_cache_version)
+    cache_version: IntProperty(name="Cache Version", default=0)
+
+
+
+@functools.lru_cache(maxsize=1024)
+def shorten_path(path):
+    """Shorten a path for display to its last 3 components (memoized, library paths repeat a lot)"""
+    path_parts = path.split(os.sep)
+    if len(path_parts) > 3:
+        return "..." + os.sep + os.sep.join(path_parts[-3:])
+    return path
+
+
+class MissingEntry:
+    """Record for a missing file gathered during a scan, filled in by the first datablock using it"""
+    __slots__ = ('file_name', 'file_type', 'materials', 'objects', 'node_names',
+                 'is_linked', 'library_path', 'modifier_name')
+    
+    def __init__(self):
+        self.file_name = ''
+        self.file_type = ''
+        self.materials = set()
+        self.objects = set()
+        self.node_names = set()
+        self.is_linked = False
+        self.library_path = ''
+        self.modifier_name = ''
+
+
+# Highest cache_version handed out this session. Undo restores a scene's old
+# version number, so new versions must never reuse one the caches may hold
+last_cache_version = 0
+
+
+def bump_cache_version(settings):
+    """Give the missing files list a cache_version not used before in this session"""
+    global last_cache_version
+    last_cache_version = max(last_cache_version, settings.cache_version) + 1
+    settings.cache_version = last_cache_version
+
 
+def tag_redraw_node_editors(context):
+    """Redraw only the editors showing the Missing Files panel"""
+    if context.screen is None:
+        return
+    for area in context.screen.areas:
+        if area.type == 'NODE_EDITOR':
+            area.tag_redraw()
+
+
+def scan_missing_files(context):
+    """Scan the scene for all missing files and fill the missing_files list, returns the count"""
+    # Clear existing list, and drop paths resolved for the previous scan
+    context.scene.missing_files.clear()
+    resolve_path.cache_clear()
+    
+    # {filepath: entry}, entries are created blank on first access
+    missing_files = defaultdict(MissingEntry)
+    
+    # The blend file directory doesn't change during a scan, so resolve
+    # '//' relative paths against it directly instead of via bpy.path.abspath
+    blend_dir = os.path.dirname(bpy.data.filepath)
+    
+    def abspath(filepath):
+        return resolve_path(filepath, blend_dir)
+    
+    # Cache existence checks per filepath - the same file is often
+    # referenced by many nodes across many materials
+    exists_cache = {}
+    
+    # Directory listings for this scan only, so files added later are seen
+    dir_cache = {}
+    
+    def is_missing(filepath):
+        if not filepath:
+            return False
+        exists = exists_cache.get(filepath)
+        if exists is None:
+            exists = check_udim_exists(abspath(filepath), dir_cache, blend_dir)
+            exists_cache[filepath] = exists
+        return not exists
+    
+    # Linked images are read-only, skip them entirely when not wanted
+    skip_linked = not context.scene.missing_file_settings.include_linked
+    
+    # Missing filepath per image datablock (None if packed, linked and skipped, or found)
+    image_state = {}
+    
+    # Scan for missing IMAGE and MOVIE files (image texture nodes)
+    # Each RNA attribute access crosses into Blender, so values used more
+    # than once are read into locals
+    for material in bpy.data.materials:
+        node_tree = material.node_tree
+        if material.use_nodes and node_tree:
+            for node in node_tree.nodes:
+                # Image textures (including video textures)
+                if node.type != 'TEX_IMAGE':
+                    continue
+                image = node.image
+                if not image:
+                    continue
+                
+                # Packed/existence checks run once per image datablock since
+                # the same image is usually shared by many nodes
+                if image in image_state:
+                    filepath = image_state[image]
+                else:
+                    # Skip packed images - they're embedded in the file, not missing!
+                    if image.packed_file is not None:
+                        filepath = None
+                    elif skip_linked and image.library is not None:
+                        filepath = None
+                    else:
+                        filepath = image.filepath
+                        if not is_missing(filepath):
+                            filepath = None
+                    image_state[image] = filepath
+                
+                if filepath is None:
+                    continue
+                
+                entry = missing_files[filepath]
+                if not entry.file_type:
+                    # Determine if it's linked and what type
+                    library = image.library
+                    is_linked = library is not None
+                    if is_linked:
+                        file_type = 'LINKED'
+                    elif image.source == 'MOVIE':
+                        file_type = 'MOVIE'
+                    else:
+                        file_type = 'IMAGE'
+                    
+                    entry.file_name = image.name
+                    entry.file_type = file_type
+                    entry.is_linked = is_linked
+                    entry.library_path = library.filepath if is_linked else ''
+                
+                entry.materials.add(material.name)
+                entry.node_names.add(node.name)
+    
+    # Gather the objects using each missing texture in one pass, only
+    # needed when a texture is actually missing
+    if missing_files:
+        mat_to_objs = defaultdict(set)
+        for obj in bpy.data.objects:
+            materials = obj.data.materials if obj.type == 'MESH' and obj.data else None
+            if materials:
+                obj_name = obj.name
+                for mat in materials:
+                    if mat:
+                        mat_to_objs[mat.name].add(obj_name)
+        
+        for data in missing_files.values():
+            for mat_name in data.materials:
+                data.objects.update(mat_to_objs.get(mat_name, ()))
+    
+    # Scan for missing movie clips (sequencer, motion tracking)
+    for clip in bpy.data.movieclips:
+        filepath = clip.filepath
+        if is_missing(filepath):
+            entry = missing_files[filepath]
+            if not entry.file_type:
+                entry.file_name = clip.name
+                entry.file_type = 'MOVIE CLIP'
+    
+    # Scan for missing SOUND files
+    for sound in bpy.data.sounds:
+        filepath = sound.filepath
+        if is_missing(filepath):
+            entry = missing_files[filepath]
+            if not entry.file_type:
+                entry.file_name = sound.name
+                entry.file_type = 'SOUND'
+    
+    # Scan for cache files (Alembic, USD, etc.)
+    for obj, modifier, filepath in iter_file_modifiers():
+        # Check Mesh Cache modifier
+        if modifier.type == 'MESH_CACHE' and is_missing(filepath):
+            # Get filename - handle cases where filepath is just a directory
+            filename = os.path.basename(filepath)
+            if not filename:  # filepath is a directory or empty
+                # Try to get filename from the full path
+                abs_path = abspath(filepath)
+                filename = os.path.basename(abs_path.rstrip('/\\'))
+                if not filename:
+                    filename = f"{modifier.name}_cache"
+            
+            entry = missing_files[filepath]
+            if not entry.file_type:
+                entry.file_name = filename
+                entry.file_type = 'CACHE'
+                entry.objects.add(obj.name)
+                entry.modifier_name = modifier.name  # Store modifier name for reference
+    
+    # Add to the collection property
+    items = context.scene.missing_files
+    for filepath, data in missing_files.items():
+        item = items.add()
+        item.filepath = filepath
+        item.base_name = os.path.basename(filepath)
+        item.file_name = data.file_name
+        item.file_type = data.file_type
+        item.file_type_index = FILE_TYPE_INDICES.get(data.file_type, 0)
+        item.packed_names = pack_names(data.materials, data.objects, data.node_names)
+        item.is_used = len(data.objects) > 0
+        item.is_linked = data.is_linked
+        item.library_path = data.library_path
+        item.short_filepath = shorten_path(filepath)
+        item.short_library_path = shorten_path(data.library_path)
+    
+    bump_cache_version(context.scene.missing_file_settings)
+    tag_redraw_node_editors(context)
+    
+    return len(missing_files)
+
+
+def remove_missing_entries(context, filepaths):
+    """Drop the entries for these filepaths from the missing_files list, cheaper than a full re-scan after relinking"""
+    items = context.scene.missing_files
+    for index in range(len(items) - 1, -1, -1):
+        if items[index].filepath in filepaths:
+            items.remove(index)
+    
+    bump_cache_version(context.scene.missing_file_settings)
+    tag_redraw_node_editors(context)
+
+
+def find_missing_in_folders(context, folders, blend_dir):
+    """Search folders recursively for the missing files, returns ({missing_filepath: found_path}, directories_searched)"""
+    missing_files = context.scene.missing_files
+    
+    # Names to look for, the search stops early once all are found
+    wanted = {os.path.normcase(get_base_name(missing_item)) for missing_item in missing_files}
+    
+    # Search recursively through all locations: {filename: first_path}
+    file_index, directories_searched = index_folders(folders, wanted)
+    
+    # Dictionary to store found files: {missing_filepath: found_path}
+    found_files = {}
+    
+    # Look up each missing file in the index (UDIM-aware)
+    for missing_item in missing_files:
+        if missing_item.filepath in found_files:
+            continue
+        
+        found_path = find_in_file_index(file_index, get_base_name(missing_item))
+        
+        if found_path:
+            if DEBUG:
+                print(f"      ✓ FOUND: {get_base_name(missing_item)} in {os.path.dirname(found_path)}")
+            # Convert to relative path if possible
+            found_files[missing_item.filepath] = make_relative(found_path, blend_dir)
+    
+    print(f"\nSearch complete!")
+    print(f"Directories searched: {directories_searched}")
+    print(f"Files found: {len(found_files)}")
+    
+    return found_files, directories_searched
 
 
 class FILE_OT_scan_missing(Operator):
@@ -98,139 +756,8 @@ class FILE_OT_scan_missing(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        # Clear existing list
-        context.scene.missing_files.clear()
-        
-        missing_files = {}
-        
-        # Scan for missing IMAGE files
-        for material in bpy.data.materials:
-            if material.use_nodes and material.node_tree:
-                for node in material.node_tree.nodes:
-                    # Image textures
-                    if node.type == 'TEX_IMAGE' and node.image:
-                        image = node.image
-                        
-                        # Skip packed images - they're embedded in the file, not missing!
-                        if image.packed_file is not None:
-                            continue
-                        
-                        if image.filepath and not check_udim_exists(image.filepath):
-                            filepath = image.filepath
-                            
-                            if filepath not in missing_files:
-                                # Determine if it's linked and what type
-                                is_linked = image.library is not None
-                                file_type = 'LINKED' if is_linked else 'IMAGE'
-                                
-                                missing_files[filepath] = {
-                                    'file_name': image.name,
-                                    'file_type': file_type,
-                                    'materials': set(),
-                                    'objects': set(),
-                                    'node_names': set(),
-                                    'is_linked': is_linked,
-                                    'library_path': image.library.filepath if is_linked else ''
-                                }
-                            
-                            missing_files[filepath]['materials'].add(material.name)
-                            missing_files[filepath]['node_names'].add(node.name)
-                            
-                            for obj in bpy.data.objects:
-                                if obj.type == 'MESH' and obj.data.materials:
-                                    if material.name in [mat.name for mat in obj.data.materials if mat]:
-                                        missing_files[filepath]['objects'].add(obj.name)
-        
-        # Scan for missing MOVIE files (video textures)
-        for material in bpy.data.materials:
-            if material.use_nodes and material.node_tree:
-                for node in material.node_tree.nodes:
-                    if node.type == 'TEX_IMAGE' and node.image and node.image.source == 'MOVIE':
-                        image = node.image
-                        
-                        # Skip packed movie files
-                        if image.packed_file is not None:
-                            continue
-                        
-                        if image.filepath and not check_udim_exists(image.filepath):
-                            filepath = image.filepath
-                            
-                            if filepath not in missing_files:
-                                missing_files[filepath] = {
-                                    'file_name': image.name,
-                                    'file_type': 'MOVIE',
-                                    'materials': set(),
-                                    'objects': set(),
-                                    'node_names': set()
-                                }
-        
-        # Scan for missing movie clips (sequencer, motion tracking)
-        for clip in bpy.data.movieclips:
-            if clip.filepath and not os.path.exists(bpy.path.abspath(clip.filepath)):
-                filepath = clip.filepath
-                if filepath not in missing_files:
-                    missing_files[filepath] = {
-                        'file_name': clip.name,
-                        'file_type': 'MOVIE CLIP',
-                        'materials': set(),
-                        'objects': set(),
-                        'node_names': set()
-                    }
-        
-        # Scan for missing SOUND files
-        for sound in bpy.data.sounds:
-            if sound.filepath and not os.path.exists(bpy.path.abspath(sound.filepath)):
-                filepath = sound.filepath
-                if filepath not in missing_files:
-                    missing_files[filepath] = {
-                        'file_name': sound.name,
-                        'file_type': 'SOUND',
-                        'materials': set(),
-                        'objects': set(),
-                        'node_names': set()
-                    }
-        
-        # Scan for cache files (Alembic, USD, etc.)
-        for obj in bpy.data.objects:
-            for modifier in obj.modifiers:
-                # Check Mesh Cache modifier
-                if modifier.type == 'MESH_CACHE':
-                    filepath = modifier.filepath
-                    if filepath and not os.path.exists(bpy.path.abspath(filepath)):
-                        # Get filename - handle cases where filepath is just a directory
-                        filename = os.path.basename(filepath)
-                        if not filename:  # filepath is a directory or empty
-                            # Try to get filename from the full path
-                            abs_path = bpy.path.abspath(filepath)
-                            filename = os.path.basename(abs_path.rstrip('/\\'))
-                            if not filename:
-                                filename = f"{modifier.name}_cache"
-                        
-                        if filepath not in missing_files:
-                            missing_files[filepath] = {
-                                'file_name': filename,
-                                'file_type': 'CACHE',
-                                'materials': set(),
-                                'objects': {obj.name},
-                                'node_names': set(),
-                                'modifier_name': modifier.name  # Store modifier name for reference
-                            }
-
-        
-        # Add to the collection property
-        for filepath, data in missing_files.items():
-            item = context.scene.missing_files.add()
-            item.filepath = filepath
-            item.file_name = data['file_name']
-            item.file_type = data['file_type']
-            item.material_names = ", ".join(sorted(data['materials'])) if data['materials'] else "(none)"
-            item.object_names = ", ".join(sorted(data['objects'])) if data['objects'] else "(unused)"
-            item.node_names = ", ".join(sorted(data['node_names'])) if data['node_names'] else "(none)"
-            item.is_used = len(data['objects']) > 0
-            item.is_linked = data.get('is_linked', False)
-            item.library_path = data.get('library_path', '')
-        
-        self.report({'INFO'}, f"Found {len(missing_files)} missing files")
+        count = scan_missing_files(context)
+        self.report({'INFO'}, f"Found {count} missing files")
         return {'FINISHED'}
 
 
@@ -269,7 +796,7 @@ class FILE_OT_relink_single(Operator):
                 return {'CANCELLED'}
         
         # It's a file - check for name/type differences
-        old_filename = os.path.basename(item.filepath)
+        old_filename = get_base_name(item)
         old_name, old_ext = os.path.splitext(old_filename)
         
         new_filename = os.path.basename(item.new_filepath)
@@ -295,7 +822,7 @@ class FILE_OT_relink_single(Operator):
         item = context.scene.missing_files[self.index]
         layout = self.layout
         
-        old_filename = os.path.basename(item.filepath)
+        old_filename = get_base_name(item)
         old_name, old_ext = os.path.splitext(old_filename)
         
         # Get the actual new filepath (resolve if it's a folder)
@@ -337,6 +864,7 @@ class FILE_OT_relink_single(Operator):
             return {'CANCELLED'}
         
         new_path = bpy.path.abspath(item.new_filepath)
+        blend_dir = os.path.dirname(bpy.data.filepath)
         
         # If user selected a folder, search recursively for all missing files
         if os.path.isdir(new_path):
@@ -347,93 +875,34 @@ class FILE_OT_relink_single(Operator):
             print(f"Total missing files: {len(context.scene.missing_files)}")
             print()
             
-            # Dictionary to store found files: {missing_filepath: found_path}
-            found_files = {}
-            directories_searched = 0
-            
-            # Search recursively through the entire folder
-            for root, dirs, files in os.walk(new_path):
-                directories_searched += 1
-                print(f"  [{directories_searched}] Checking: {root}")
-                
-                # Check each missing file
-                for missing_item in context.scene.missing_files:
-                    if missing_item.filepath in found_files:
-                        continue
-                    
-                    # Use UDIM-aware search
-                    found_path = find_udim_file(missing_item.filepath, root)
-                    
-                    if found_path:
-                        print(f"      ✓ FOUND: {os.path.basename(missing_item.filepath)}")
-                        # Convert to relative path if possible
-                        if bpy.data.filepath:
-                            try:
-                                found_path = bpy.path.relpath(found_path)
-                            except:
-                                pass
-                        found_files[missing_item.filepath] = found_path
+            # Search recursively: {missing_filepath: found_path}
+            found_files = find_missing_in_folders(context, [new_path], blend_dir)[0]
             
-            print(f"\nSearch complete!")
-            print(f"Directories searched: {directories_searched}")
-            print(f"Files found: {len(found_files)}")
             print("="*80 + "\n")
             
             # Check if we found the primary file at least
             if item.filepath not in found_files:
-                self.report({'ERROR'}, f"File '{os.path.basename(item.filepath)}' not found in selected folder or its subdirectories")
+                self.report({'ERROR'}, f"File '{get_base_name(item)}' not found in selected folder or its subdirectories")
                 return {'CANCELLED'}
             
             # Relink all found files
+            by_filepath = build_filepath_index()
             relinked_count = 0
             
-            for missing_item in context.scene.missing_files:
-                if missing_item.filepath not in found_files:
-                    continue
-                
-                found_path = found_files[missing_item.filepath]
-                old_filepath = missing_item.filepath
-                
-                # Update images
-                for image in bpy.data.images:
-                    if image.filepath == old_filepath and image.library is None:
-                        try:
-                            image.filepath = found_path
-                            image.reload()
-                            relinked_count += 1
-                        except:
-                            pass
-                
-                # Update movie clips
-                for clip in bpy.data.movieclips:
-                    if clip.filepath == old_filepath and clip.library is None:
-                        try:
-                            clip.filepath = found_path
-                            relinked_count += 1
-                        except:
-                            pass
-                
-                # Update sounds
-                for sound in bpy.data.sounds:
-                    if sound.filepath == old_filepath and sound.library is None:
-                        try:
-                            sound.filepath = found_path
-                            relinked_count += 1
-                        except:
-                            pass
-                
-                # Update cache modifiers
-                for obj in bpy.data.objects:
-                    for modifier in obj.modifiers:
-                        if hasattr(modifier, 'filepath') and modifier.filepath == old_filepath:
-                            try:
-                                modifier.filepath = found_path
-                                relinked_count += 1
-                            except:
-                                pass
+            relinked_paths = set()
+            to_reload = set()
+            
+            for old_filepath, found_path in found_files.items():
+                count, skipped = relink_datablocks(by_filepath.get(old_filepath, ()), found_path, to_reload)
+                if count and not skipped:
+                    relinked_paths.add(old_filepath)
+                relinked_count += count
             
-            # Re-scan to update the list
-            bpy.ops.file.scan_missing()
+            # Reload the relinked images once all paths are set
+            reload_images(to_reload)
+            
+            # Update the list (files whose datablocks are all linked stay listed)
+            remove_missing_entries(context, relinked_paths)
             
             num_files = len(found_files)
             if num_files == 1:
@@ -453,118 +922,66 @@ class FILE_OT_relink_single(Operator):
         
         old_filepath = item.filepath
         updated_count = 0
-        
-        # Update images
         linked_count = 0
-        for image in bpy.data.images:
-            if image.filepath == old_filepath:
-                # Check if this is a linked datablock (read-only)
-                if image.library is not None:
-                    print(f"DEBUG: Skipping linked image: {image.name} from library: {image.library.filepath}")
-                    linked_count += 1
-                    continue  # Skip linked datablocks
-                try:
-                    image.filepath = item.new_filepath
-                    image.reload()
-                    updated_count += 1
-                except Exception as e:
+        
+        # Index datablocks by filepath once for this relink and the auto-relink below
+        by_filepath = build_filepath_index()
+        
+        # Update images, movie clips, sounds and cache modifiers
+        for kind, datablock in by_filepath.get(old_filepath, ()):
+            # Check if this is a linked datablock (read-only)
+            if kind != 'CACHE' and datablock.library is not None:
+                if DEBUG and kind == 'IMAGE':
+                    print(f"DEBUG: Skipping linked image: {datablock.name} from library: {datablock.library.filepath}")
+                linked_count += 1
+                continue  # Skip linked datablocks
+            try:
+                datablock.filepath = item.new_filepath
+                if kind == 'IMAGE':
+                    datablock.reload()
+                updated_count += 1
+            except Exception as e:
+                if kind == 'IMAGE':
                     self.report({'ERROR'}, f"Failed to reload image: {str(e)}")
                     return {'CANCELLED'}
+                self.report({'ERROR'}, f"Failed to update {kind.lower()}: {str(e)}")
         
-        # Update movie clips
-        for clip in bpy.data.movieclips:
-            if clip.filepath == old_filepath:
-                if clip.library is not None:
-                    linked_count += 1
-                    continue
-                try:
-                    clip.filepath = item.new_filepath
-                    updated_count += 1
-                except Exception as e:
-                    self.report({'ERROR'}, f"Failed to update movie clip: {str(e)}")
-        
-        # Update sounds
-        for sound in bpy.data.sounds:
-            if sound.filepath == old_filepath:
-                if sound.library is not None:
-                    linked_count += 1
-                    continue
-                try:
-                    sound.filepath = item.new_filepath
-                    updated_count += 1
-                except Exception as e:
-                    self.report({'ERROR'}, f"Failed to update sound: {str(e)}")
-        
-        # Update cache modifiers
-        for obj in bpy.data.objects:
-            for modifier in obj.modifiers:
-                if hasattr(modifier, 'filepath') and modifier.filepath == old_filepath:
-                    try:
-                        modifier.filepath = item.new_filepath
-                        updated_count += 1
-                    except Exception as e:
-                        self.report({'ERROR'}, f"Failed to update cache: {str(e)}")
+        # Files to take off the list once done
+        # (linked datablocks still point at the old path, so those files stay)
+        relinked_paths = {old_filepath} if updated_count and not linked_count else set()
         
         # Auto-relink other files in the same directory
         new_dir = os.path.dirname(bpy.path.abspath(item.new_filepath))
         auto_relinked = 0
         
-        if os.path.exists(new_dir):
+        # (skipped if the folder is gone or can't be read)
+        listing = list_folder(new_dir)
+        if listing is not None:
+            # List the directory once instead of probing it for every file
+            dir_index = {}
+            add_to_file_index(dir_index, new_dir, listing[0])
+            to_reload = set()
+            
             # Get all missing files
             for other_item in context.scene.missing_files:
                 if other_item.filepath == old_filepath:
                     continue  # Skip the file we just relinked
                 
-                # Check if this file exists in the same directory
-                other_filename = os.path.basename(other_item.filepath)
-                potential_path = os.path.join(new_dir, other_filename)
-                
-                # Check existence (handle UDIM)
-                file_exists = check_udim_exists(potential_path) if "<UDIM>" in potential_path else os.path.exists(potential_path)
+                # Check if this file exists in the same directory (handles UDIM)
+                potential_path = find_in_file_index(dir_index, get_base_name(other_item))
                 
-                if file_exists:
+                if potential_path:
                     # Convert to relative path
-                    try:
-                        relative_path = bpy.path.relpath(potential_path)
-                    except:
-                        relative_path = potential_path
-                    
-                    old_path = other_item.filepath
+                    relative_path = make_relative(potential_path, blend_dir)
                     
                     # Update the datablocks
-                    for image in bpy.data.images:
-                        if image.filepath == old_path and image.library is None:
-                            try:
-                                image.filepath = relative_path
-                                image.reload()
-                                auto_relinked += 1
-                            except:
-                                pass
-                    
-                    for clip in bpy.data.movieclips:
-                        if clip.filepath == old_path:
-                            try:
-                                clip.filepath = relative_path
-                                auto_relinked += 1
-                            except:
-                                pass
-                    
-                    for sound in bpy.data.sounds:
-                        if sound.filepath == old_path:
-                            try:
-                                sound.filepath = relative_path
-                                auto_relinked += 1
-                            except:
-                                pass
-                    
-                    for obj in bpy.data.objects:
-                        for modifier in obj.modifiers:
-                            if hasattr(modifier, 'filepath') and modifier.filepath == old_path:
-                                try:
-                                    modifier.filepath = relative_path
-                                    auto_relinked += 1
-                                except:
-                                    pass
+                    count, skipped = relink_datablocks(by_filepath.get(other_item.filepath, ()), relative_path, to_reload)
+                    if count and not skipped:
+                        relinked_paths.add(other_item.filepath)
+                    auto_relinked += count
+            
+            # Reload the relinked images once all paths are set
+            reload_images(to_reload)
         
         # Build success message
         message = f"Relinked {updated_count} file(s)"
@@ -576,8 +993,8 @@ class FILE_OT_relink_single(Operator):
         else:
             self.report({'INFO'}, message)
         
-        # Re-scan to update the list
-        bpy.ops.file.scan_missing()
+        # Update the list
+        remove_missing_entries(context, relinked_paths)
         
         return {'FINISHED'}
 
@@ -618,7 +1035,7 @@ class FILE_OT_auto_search(Operator):
         print(f"Looking for: {item.filepath}")
         
         # Get the filename from the original path
-        original_filename = os.path.basename(item.filepath)
+        original_filename = get_base_name(item)
         
         if not original_filename:
             self.report({'ERROR'}, "Cannot extract filename from path")
@@ -654,48 +1071,19 @@ class FILE_OT_auto_search(Operator):
             print(f"  - {sp}")
         print()
         
-        # Dictionary to store found files: {missing_filepath: found_path}
-        found_files = {}
-        
-        # Search recursively through all locations
-        directories_searched = 0
-        for search_path in search_paths:
-            print(f"Searching in: {search_path}")
-            # Walk through the entire directory tree
-            for root, dirs, files in os.walk(search_path):
-                directories_searched += 1
-                print(f"  [{directories_searched}] Checking: {root}")
-                
-                # Check each missing file to see if it exists in this directory
-                for missing_item in context.scene.missing_files:
-                    # Skip if we already found this file
-                    if missing_item.filepath in found_files:
-                        continue
-                    
-                    # Use UDIM-aware search
-                    found_path = find_udim_file(missing_item.filepath, root)
-                    
-                    if found_path:
-                        print(f"      ✓ FOUND: {os.path.basename(missing_item.filepath)} in {root}")
-                        # Convert to relative path if possible
-                        if bpy.data.filepath:
-                            try:
-                                found_path = bpy.path.relpath(found_path)
-                            except:
-                                pass
-                        found_files[missing_item.filepath] = found_path
-        
-        print(f"\nSearch complete!")
-        print(f"Directories searched: {directories_searched}")
-        print(f"Files found: {len(found_files)}")
-        if found_files:
+        # Search recursively: {missing_filepath: found_path}
+        found_files = find_missing_in_folders(context, search_paths, blend_dir)[0]
+        if DEBUG and found_files:
             print("\nFound files:")
             for orig_path, new_path in found_files.items():
                 print(f"  {os.path.basename(orig_path)} -> {new_path}")
         print("="*80 + "\n")
         
         # Now relink all found files
+        by_filepath = build_filepath_index()
         relinked_count = 0
+        relinked_paths = set()
+        to_reload = set()
         primary_found = False
         
         for missing_item in context.scene.missing_files:
@@ -709,51 +1097,20 @@ class FILE_OT_auto_search(Operator):
                 primary_found = True
                 missing_item.new_filepath = found_path
             
-            print(f"Relinking: {os.path.basename(missing_item.filepath)}")
+            if DEBUG:
+                print(f"Relinking: {get_base_name(missing_item)}")
             
             # Relink all datablocks using this file
-            old_filepath = missing_item.filepath
-            
-            # Update images
-            for image in bpy.data.images:
-                if image.filepath == old_filepath and image.library is None:
-                    try:
-                        image.filepath = found_path
-                        image.reload()
-                        relinked_count += 1
-                    except:
-                        pass
-            
-            # Update movie clips
-            for clip in bpy.data.movieclips:
-                if clip.filepath == old_filepath and clip.library is None:
-                    try:
-                        clip.filepath = found_path
-                        relinked_count += 1
-                    except:
-                        pass
-            
-            # Update sounds
-            for sound in bpy.data.sounds:
-                if sound.filepath == old_filepath and sound.library is None:
-                    try:
-                        sound.filepath = found_path
-                        relinked_count += 1
-                    except:
-                        pass
-            
-            # Update cache modifiers
-            for obj in bpy.data.objects:
-                for modifier in obj.modifiers:
-                    if hasattr(modifier, 'filepath') and modifier.filepath == old_filepath:
-                        try:
-                            modifier.filepath = found_path
-                            relinked_count += 1
-                        except:
-                            pass
-        
-        # Re-scan to update the list
-        bpy.ops.file.scan_missing()
+            count, skipped = relink_datablocks(by_filepath.get(missing_item.filepath, ()), found_path, to_reload)
+            if count and not skipped:
+                relinked_paths.add(missing_item.filepath)
+            relinked_count += count
+        
+        # Reload the relinked images once all paths are set
+        reload_images(to_reload)
+        
+        # Update the list
+        remove_missing_entries(context, relinked_paths)
         
         # Report results
         if not primary_found:
@@ -780,30 +1137,21 @@ class FILE_OT_remove_file(Operator):
     def execute(self, context):
         item = context.scene.missing_files[self.index]
         
-        removed_count = 0
-        
-        # Remove images
-        images_to_remove = [img for img in bpy.data.images if img.filepath == item.filepath]
-        for image in images_to_remove:
-            bpy.data.images.remove(image)
-            removed_count += 1
-        
-        # Remove movie clips
-        clips_to_remove = [clip for clip in bpy.data.movieclips if clip.filepath == item.filepath]
-        for clip in clips_to_remove:
-            bpy.data.movieclips.remove(clip)
-            removed_count += 1
-        
-        # Remove sounds
-        sounds_to_remove = [sound for sound in bpy.data.sounds if sound.filepath == item.filepath]
-        for sound in sounds_to_remove:
-            bpy.data.sounds.remove(sound)
-            removed_count += 1
+        # Remove images, movie clips and sounds using this file in one batch
+        # (cache modifiers aren't datablocks, leave them alone)
+        users = build_filepath_index().get(item.filepath, ())
+        datablocks = [datablock for kind, datablock in users if kind != 'CACHE']
+        if datablocks:
+            bpy.data.batch_remove(datablocks)
+        removed_count = len(datablocks)
         
         self.report({'INFO'}, f"Removed {removed_count} file datablock(s)")
         
-        # Re-scan to update the list
-        bpy.ops.file.scan_missing()
+        # Update the list, a file still used by cache modifiers needs a re-scan
+        if removed_count == len(users):
+            remove_missing_entries(context, {item.filepath})
+        else:
+            scan_missing_files(context)
         
         return {'FINISHED'}
     
@@ -826,37 +1174,25 @@ class FILE_OT_purge_all_orphans(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        removed_count = 0
+        # Step 1: Remove objects not in any scene (Blender's purge doesn't do this)
+        in_any_scene = set()
+        for scene in bpy.data.scenes:
+            in_any_scene.update(scene.objects.keys())
         
-        # Step 0: Run Blender's built-in recursive purge first
-        # This removes standard orphaned datablocks (meshes, materials, images with 0 users)
-        bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+        objects_to_remove = [obj for obj in bpy.data.objects if obj.name not in in_any_scene]
         
-        # Step 1: Now remove objects not in any scene (Blender's purge doesn't do this)
-        objects_to_remove = []
-        for obj in bpy.data.objects:
-            in_scene = False
-            for scene in bpy.data.scenes:
-                try:
-                    if obj.name in scene.objects.keys():
-                        in_scene = True
-                        break
-                except:
-                    pass
-            
-            if not in_scene:
-                objects_to_remove.append(obj)
+        # Remove them in one batch, this also unlinks them from their collections
+        if objects_to_remove:
+            bpy.data.batch_remove(objects_to_remove)
+        removed_count = len(objects_to_remove)
         
-        for obj in objects_to_remove:
-            try:
-                bpy.data.objects.remove(obj, do_unlink=True)
-                removed_count += 1
-            except:
-                pass
-        
-        # Step 2: Run the built-in purge again to clean up dependencies
+        # Step 2: Run Blender's built-in recursive purge, this removes standard orphaned
+        # datablocks (meshes, materials, images with 0 users) including what the
+        # removed objects used
         bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
         
+        bump_cache_version(context.scene.missing_file_settings)
+        
         self.report({'INFO'}, f"Purged {removed_count} orphaned object(s) + standard orphaned data")
         return {'FINISHED'}
     
@@ -873,6 +1209,48 @@ class FILE_OT_purge_all_orphans(Operator):
         layout.label(text="This cannot be easily undone!")
 
 
+class FILE_OT_show_file_details(Operator):
+    """Show the original path and what uses this missing file"""
+    bl_idname = "file.show_file_details"
+    bl_label = "Missing File Details"
+    bl_options = {'INTERNAL'}
+    
+    index: IntProperty()
+    
+    def execute(self, context):
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_popup(self, width=400)
+    
+    def draw(self, context):
+        item = context.scene.missing_files[self.index]
+        layout = self.layout
+        
+        layout.label(text=f"File: {item.file_name}", icon='TEXTURE')
+        
+        # For linked files, show library path
+        if item.is_linked and item.library_path:
+            col = layout.box().column(align=True)
+            col.label(text="Linked from:")
+            col.label(text=item.short_library_path or shorten_path(item.library_path))
+            col.label(text="(Read-only - fix in original file)", icon='INFO')
+        
+        # Original path and usage
+        col = layout.box().column(align=True)
+        col.label(text="Original Path:")
+        col.label(text=item.short_filepath or shorten_path(item.filepath))
+        
+        # Lists saved before the usage was stored have packed_names empty
+        if not item.packed_names:
+            col.label(text="Re-scan to see usage", icon='INFO')
+            return
+        
+        materials, objects, node_names = unpack_names(item.packed_names)
+        col.label(text=f"Materials: {', '.join(materials) or '(none)'}")
+        col.label(text=f"Objects: {', '.join(objects) or '(unused)'}")
+
+
 class FILE_OT_export_report(Operator):
     """Export a text file report of all missing files"""
     bl_idname = "file.export_report"
@@ -887,50 +1265,65 @@ class FILE_OT_export_report(Operator):
             return {'CANCELLED'}
         
         try:
-            with open(self.filepath, 'w') as f:
-                f.write("=" * 80 + "\n")
-                f.write("MISSING FILES REPORT\n")
-                f.write("=" * 80 + "\n\n")
-                
-                if bpy.data.filepath:
-                    f.write(f"Blend File: {bpy.data.filepath}\n\n")
-                
-                f.write(f"Total Missing Files: {len(context.scene.missing_files)}\n\n")
+            # Build the report in memory and write it out in one go
+            parts = []
+            write = parts.append
+            
+            write("=" * 80 + "\n")
+            write("MISSING FILES REPORT\n")
+            write("=" * 80 + "\n\n")
+            
+            if bpy.data.filepath:
+                write(f"Blend File: {bpy.data.filepath}\n\n")
+            
+            write(f"Total Missing Files: {len(context.scene.missing_files)}\n\n")
+            
+            # Group by type
+            files_by_type = defaultdict(list)
+            for item in context.scene.missing_files:
+                files_by_type[item.file_type].append(item)
+            
+            # Write each type group, in panel order followed by any other types
+            # (e.g. MOVIE CLIP)
+            report_types = [group[0] for group in FILE_TYPE_GROUPS]
+            report_types += [file_type for file_type in files_by_type if file_type not in FILE_TYPE_INDICES]
+            for file_type in report_types:
+                items = files_by_type.get(file_type)
+                if not items:
+                    continue
                 
-                # Group by type
-                files_by_type = {}
-                for item in context.scene.missing_files:
-                    file_type = item.file_type
-                    if file_type not in files_by_type:
-                        files_by_type[file_type] = []
-                    files_by_type[file_type].append(item)
+                write("=" * 80 + "\n")
+                write(f"{file_type} FILES ({len(items)})\n")
+                write("=" * 80 + "\n\n")
                 
-                # Write each type group
-                for file_type, items in sorted(files_by_type.items()):
-                    f.write("=" * 80 + "\n")
-                    f.write(f"{file_type} FILES ({len(items)})\n")
-                    f.write("=" * 80 + "\n\n")
+                for item in items:
+                    write(f"File: {item.file_name}\n")
+                    write(f"Path: {item.filepath}\n")
+                    write(f"Status: {'USED' if item.is_used else 'UNUSED'}\n")
                     
-                    for item in items:
-                        f.write(f"File: {item.file_name}\n")
-                        f.write(f"Path: {item.filepath}\n")
-                        f.write(f"Status: {'USED' if item.is_used else 'UNUSED'}\n")
-                        
-                        if item.is_linked:
-                            f.write(f"Linked from: {item.library_path}\n")
-                        
-                        if item.material_names != "(none)":
-                            f.write(f"Materials: {item.material_names}\n")
-                        if item.object_names != "(unused)":
-                            f.write(f"Objects: {item.object_names}\n")
-                        if item.node_names != "(none)":
-                            f.write(f"Nodes: {item.node_names}\n")
-                        
-                        f.write("\n" + "-" * 80 + "\n\n")
-                
-                f.write("\n" + "=" * 80 + "\n")
-                f.write("END OF REPORT\n")
-                f.write("=" * 80 + "\n")
+                    if item.is_linked:
+                        write(f"Linked from: {item.library_path}\n")
+                    
+                    # Lists saved before the usage was stored have packed_names empty
+                    if not item.packed_names:
+                        write("Usage: unknown, re-scan to see usage\n")
+                    
+                    materials, objects, node_names = unpack_names(item.packed_names)
+                    if materials:
+                        write(f"Materials: {', '.join(materials)}\n")
+                    if objects:
+                        write(f"Objects: {', '.join(objects)}\n")
+                    if node_names:
+                        write(f"Nodes: {', '.join(node_names)}\n")
+                    
+                    write("\n" + "-" * 80 + "\n\n")
+            
+            write("\n" + "=" * 80 + "\n")
+            write("END OF REPORT\n")
+            write("=" * 80 + "\n")
+            
+            with open(self.filepath, 'w') as f:
+                f.write("".join(parts))
             
             self.report({'INFO'}, f"Report exported to: {self.filepath}")
             return {'FINISHED'}
@@ -951,6 +1344,120 @@ class FILE_OT_export_report(Operator):
         return {'RUNNING_MODAL'}
 
 
+# Plain Python copy of the fields used for filtering/grouping, per scene:
+# {scene_name: (signature, [(is_used, file_type_index), ...])}
+item_snapshot_cache = {}
+
+
+def get_item_snapshot(scene):
+    """Return [(is_used, file_type_index)] for each missing file, cached until the list changes"""
+    missing_files = scene.missing_files
+    count = len(missing_files)
+    signature = (count, scene.missing_file_settings.cache_version)
+    cached = item_snapshot_cache.get(scene.name)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    # Read the fields in bulk rather than item by item
+    used_flags = [False] * count
+    type_indices = [0] * count
+    missing_files.foreach_get("is_used", used_flags)
+    missing_files.foreach_get("file_type_index", type_indices)
+    
+    # Lists saved before file_type_index existed read back 0 for every item,
+    # so trust file_type whenever the two disagree
+    for idx, type_index in enumerate(type_indices):
+        if type_index == 0:
+            type_indices[idx] = FILE_TYPE_INDICES.get(missing_files[idx].file_type, 0)
+    snapshot = list(zip(used_flags, type_indices))
+    
+    item_snapshot_cache[scene.name] = (signature, snapshot)
+    return snapshot
+
+
+@persistent
+def clear_panel_caches(dummy):
+    """Drop cached panel data when another blend file is loaded"""
+    grouped_files_cache.clear()
+    item_snapshot_cache.clear()
+
+
+class FILE_UL_missing_files(UIList):
+    """List of missing files of one type, the list_id is the file type shown"""
+    
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(text=item.file_name, icon='CHECKMARK' if item.is_used else 'X')
+        op = row.operator("file.show_file_details", text="", icon='INFO', emboss=False)
+        op.index = index
+    
+    def filter_items(self, context, data, propname):
+        settings = context.scene.missing_file_settings
+        missing_files = getattr(data, propname)
+        files_by_type = get_grouped_files(context.scene, settings)[0]
+        
+        # Keep only this list's file type and the Used/Unused filters, from the
+        # cached grouping. Blender flips the filter bit of every item when
+        # "Invert" is on, which is only meant for the name filter, so pre-flip
+        # the items hidden here
+        hidden = self.bitflag_filter_item if self.use_filter_invert else 0
+        flags = [hidden] * len(missing_files)
+        group = files_by_type.get(self.list_id, ())
+        
+        # Standard name filter from the list's filter options
+        if self.filter_name:
+            name_flags = bpy.types.UI_UL_list.filter_items_by_name(
+                self.filter_name, self.bitflag_filter_item, missing_files, "file_name")
+            for idx in group:
+                flags[idx] = name_flags[idx]
+        else:
+            for idx in group:
+                flags[idx] = self.bitflag_filter_item
+        
+        return flags, []
+
+
+# Filtered/grouped file indices per scene for the panel: {scene_name: (signature, files_by_type)}
+grouped_files_cache = {}
+
+
+def get_grouped_files(scene, settings):
+    """Filter the missing files list and group indices by type, cached until the list or filters change.
+    
+    Returns (files_by_type, total_shown).
+    """
+    visibility = settings.visibility_flags
+    show_used = visibility & VISIBILITY_BITS['show_used']
+    show_unused = visibility & VISIBILITY_BITS['show_unused']
+    signature = (len(scene.missing_files), show_used, show_unused, settings.cache_version)
+    cached = grouped_files_cache.get(scene.name)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+    
+    files_by_type = {
+        'IMAGE': [],
+        'MOVIE': [],
+        'SOUND': [],
+        'CACHE': [],
+        'LINKED': []
+    }
+    # Bound append per group, indexed like FILE_TYPE_GROUPS
+    add_to_group = [files_by_type[group[0]].append for group in FILE_TYPE_GROUPS]
+    total_shown = 0
+    
+    for idx, (is_used, type_index) in enumerate(get_item_snapshot(scene)):
+        # Apply filter
+        if not (show_used if is_used else show_unused):
+            continue
+        
+        # Add to appropriate group
+        add_to_group[type_index](idx)
+        total_shown += 1
+    
+    grouped_files_cache[scene.name] = (signature, files_by_type, total_shown)
+    return files_by_type, total_shown
+
+
 class FILE_PT_missing_panel_shader(Panel):
     """Panel in Shader Editor for missing file management"""
     bl_label = "Missing Files"
@@ -973,6 +1480,10 @@ class FILE_PT_missing_panel_shader(Panel):
         row.scale_y = 1.5
         row.operator("file.scan_missing", text="Scan for Missing Files", icon='VIEWZOOM')
         
+        # Scan option, only applies on the next scan
+        row = layout.row()
+        row.prop(settings, "include_linked", text="Scan Linked Images")
+        
         # Export button
         row = layout.row()
         row.operator("file.export_report", icon='EXPORT')
@@ -985,144 +1496,101 @@ class FILE_PT_missing_panel_shader(Panel):
         layout.separator()
         
         # Display missing files
-        if len(scene.missing_files) == 0:
+        missing_files = scene.missing_files
+        missing_count = len(missing_files)
+        if missing_count == 0:
+            # Nothing to group or filter
             box = layout.box()
             box.label(text="No missing files found", icon='CHECKMARK')
             box.label(text="Click 'Scan' to check for issues")
-        else:
-            # Group files by type
-            files_by_type = {
-                'IMAGE': [],
-                'MOVIE': [],
-                'SOUND': [],
-                'CACHE': [],
-                'LINKED': []
-            }
+            return
+        
+        # Group files by type (cached between redraws)
+        files_by_type, total_filtered = get_grouped_files(scene, settings)
+        
+        layout.label(text=f"Missing Files: {missing_count} (Showing: {total_filtered})", icon='ERROR')
+        
+        # Display each type group
+        visibility = settings.visibility_flags
+        active_index = settings.active_index
+        active_item = missing_files[active_index] if 0 <= active_index < missing_count else None
+        
+        for file_type, group_label, icon, prop_name in FILE_TYPE_GROUPS:
+            files = files_by_type[file_type]
+            if not files:
+                continue
             
-            for idx, item in enumerate(scene.missing_files):
-                # Apply filter
-                if item.is_used and not settings.show_used:
-                    continue
-                if not item.is_used and not settings.show_unused:
-                    continue
-                
-                # Add to appropriate group
-                file_type = item.file_type
-                if file_type not in files_by_type:
-                    file_type = 'IMAGE'  # Default
-                files_by_type[file_type].append((idx, item))
+            show_prop = visibility & VISIBILITY_BITS[prop_name]
             
-            # Count total
-            total_filtered = sum(len(files) for files in files_by_type.values())
-            layout.label(text=f"Missing Files: {len(scene.missing_files)} (Showing: {total_filtered})", icon='ERROR')
+            # Type header with collapse button
+            type_box = layout.box()
+            header_row = type_box.row()
             
-            # Display each type group
-            type_info = [
-                ('IMAGE', 'Images', 'IMAGE_DATA', settings.show_images),
-                ('MOVIE', 'Movies', 'SEQUENCE', settings.show_movies),
-                ('SOUND', 'Sounds', 'SOUND', settings.show_sounds),
-                ('CACHE', 'Caches', 'FILE_CACHE', settings.show_caches),
-                ('LINKED', 'Linked Files', 'LINK_BLEND', settings.show_linked)
-            ]
+            header_row.prop(settings, prop_name,
+                           icon='TRIA_DOWN' if show_prop else 'TRIA_RIGHT',
+                           text="", emboss=False)
+            header_row.label(text=f"{group_label}: {len(files)}", icon=icon)
             
-            for file_type, label, icon, show_prop in type_info:
-                files = files_by_type[file_type]
-                if len(files) == 0:
-                    continue
-                
-                # Type header with collapse button
-                type_box = layout.box()
-                header_row = type_box.row()
-                
-                # Determine the correct property name
-                if file_type == 'IMAGE':
-                    prop_name = "show_images"
-                elif file_type == 'MOVIE':
-                    prop_name = "show_movies"
-                elif file_type == 'SOUND':
-                    prop_name = "show_sounds"
-                elif file_type == 'CACHE':
-                    prop_name = "show_caches"
-                elif file_type == 'LINKED':
-                    prop_name = "show_linked"
+            # Show files if expanded, only the visible rows are drawn
+            if show_prop:
+                type_box.template_list("FILE_UL_missing_files", file_type, scene, "missing_files",
+                                       settings, "active_index", rows=5)
                 
-                header_row.prop(settings, prop_name,
-                               icon='TRIA_DOWN' if show_prop else 'TRIA_RIGHT',
-                               text="", emboss=False)
-                header_row.label(text=f"{label}: {len(files)}", icon=icon)
-                
-                # Show files if expanded
-                if show_prop:
-                    for idx, item in files:
-                        box = type_box.box()
-                        col = box.column(align=True)
-                        
-                        # Status indicator row
-                        status_row = col.row(align=True)
-                        if item.is_used:
-                            status_row.label(text="Status: USED IN SCENE", icon='CHECKMARK')
-                        else:
-                            status_row.label(text="Status: UNUSED", icon='X')
-                        
-                        # File name
-                        col.label(text=f"File: {item.file_name}", icon='TEXTURE')
-                        
-                        # For linked files, show library path
-                        if item.is_linked and item.library_path:
-                            split_box = col.box()
-                            split_col = split_box.column(align=True)
-                            split_col.scale_y = 0.7
-                            split_col.label(text="Linked from:")
-                            lib_parts = item.library_path.split(os.sep)
-                            if len(lib_parts) > 3:
-                                split_col.label(text="..." + os.sep + os.sep.join(lib_parts[-3:]))
-                            else:
-                                split_col.label(text=item.library_path)
-                            split_col.label(text="(Read-only - fix in original file)", icon='INFO')
-                        
-                        # Original path
-                        split_box = col.box()
-                        split_col = split_box.column(align=True)
-                        split_col.scale_y = 0.7
-                        split_col.label(text="Original Path:")
-                        path_parts = item.filepath.split(os.sep)
-                        if len(path_parts) > 3:
-                            split_col.label(text="..." + os.sep + os.sep.join(path_parts[-3:]))
-                        else:
-                            split_col.label(text=item.filepath)
-                        split_col.label(text=f"Materials: {item.material_names}")
-                        split_col.label(text=f"Objects: {item.object_names}")
-                        
-                        col.separator(factor=0.5)
-                        
-                        # Only show relink options for non-linked files
-                        if item.is_linked:
-                            col.label(text="Linked files cannot be relinked here", icon='INFO')
-                        elif item.is_used:
-                            # New path input
-                            col.prop(item, "new_filepath", text="New Path")
-                            
-                            # Relink button
-                            row = col.row()
-                            row.scale_y = 1.3
-                            op = row.operator("file.relink_single", text="Relink This File", icon='LINKED')
-                            op.index = idx
-                            
-                            # Auto Find and Delete buttons
-                            row = col.row(align=True)
-                            op = row.operator("file.auto_search", text="Auto Find", icon='VIEWZOOM')
-                            op.index = idx
-                            op = row.operator("file.remove_file", text="Delete", icon='TRASH')
-                            op.index = idx
-                        else:
-                            # Unused file
-                            col.label(text="This file is not used in any objects")
-                            row = col.row()
-                            row.scale_y = 1.3
-                            op = row.operator("file.remove_file", text="Remove from File", icon='TRASH')
-                            op.index = idx
-                        
-                        type_box.separator(factor=0.5)
+                # Details and actions for the selected file
+                if active_item is not None and active_index in files:
+                    self.draw_file_details(type_box.box(), active_item, active_index)
+
+    def draw_file_details(self, box, item, idx):
+        """Draw the details and relink actions for one missing file"""
+        col = box.column(align=True)
+        label = col.label
+        
+        # Read the item's fields once, each access goes through RNA
+        is_used = item.is_used
+        is_linked = item.is_linked
+        
+        # Status indicator row
+        status_row = col.row(align=True)
+        if is_used:
+            status_row.label(text="Status: USED IN SCENE", icon='CHECKMARK')
+        else:
+            status_row.label(text="Status: UNUSED", icon='X')
+        
+        # File name
+        label(text=f"File: {item.file_name}", icon='TEXTURE')
+        
+        # Paths and usage are shown on demand in a popup
+        op = col.operator("file.show_file_details", text="Show Paths and Usage", icon='INFO')
+        op.index = idx
+        
+        col.separator(factor=0.5)
+        
+        # Only show relink options for non-linked files
+        if is_linked:
+            label(text="Linked files cannot be relinked here", icon='INFO')
+        elif is_used:
+            # New path input
+            col.prop(item, "new_filepath", text="New Path")
+            
+            # Relink button
+            row = col.row()
+            row.scale_y = 1.3
+            op = row.operator("file.relink_single", text="Relink This File", icon='LINKED')
+            op.index = idx
+            
+            # Auto Find and Delete buttons
+            row = col.row(align=True)
+            op = row.operator("file.auto_search", text="Auto Find", icon='VIEWZOOM')
+            op.index = idx
+            op = row.operator("file.remove_file", text="Delete", icon='TRASH')
+            op.index = idx
+        else:
+            # Unused file
+            label(text="This file is not used in any objects")
+            row = col.row()
+            row.scale_y = 1.3
+            op = row.operator("file.remove_file", text="Remove from File", icon='TRASH')
+            op.index = idx
 
 
 
@@ -1134,25 +1602,42 @@ classes = (
     FILE_OT_auto_search,
     FILE_OT_remove_file,
     FILE_OT_purge_all_orphans,
+    FILE_OT_show_file_details,
     FILE_OT_export_report,
+    FILE_UL_missing_files,
     FILE_PT_missing_panel_shader,
 )
 
 
 def register():
+    # Skip anything already registered so reloading the add-on doesn't
+    # rebuild the property groups and drop the current missing files list
     for cls in classes:
-        bpy.utils.register_class(cls)
+        if not cls.is_registered:
+            bpy.utils.register_class(cls)
     
-    bpy.types.Scene.missing_files = bpy.props.CollectionProperty(type=MissingFileItem)
-    bpy.types.Scene.missing_file_settings = bpy.props.PointerProperty(type=MissingFileSettings)
+    if not hasattr(bpy.types.Scene, "missing_files"):
+        bpy.types.Scene.missing_files = bpy.props.CollectionProperty(type=MissingFileItem)
+    if not hasattr(bpy.types.Scene, "missing_file_settings"):
+        bpy.types.Scene.missing_file_settings = bpy.props.PointerProperty(type=MissingFileSettings)
+    
+    if clear_panel_caches not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(clear_panel_caches)
 
 
 def unregister():
     for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+        if cls.is_registered:
+            bpy.utils.unregister_class(cls)
+    
+    if hasattr(bpy.types.Scene, "missing_files"):
+        del bpy.types.Scene.missing_files
+    if hasattr(bpy.types.Scene, "missing_file_settings"):
+        del bpy.types.Scene.missing_file_settings
     
-    del bpy.types.Scene.missing_files
-    del bpy.types.Scene.missing_file_settings
+    if clear_panel_caches in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(clear_panel_caches)
+    clear_panel_caches(None)
 
 
 if __name__ == "__main__":